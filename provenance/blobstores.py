@@ -32,6 +32,10 @@ class BaseBlobStore(object):
         method = getattr(self, '_put_' + self._on_duplicate_key)
         return method(id, value, serializer, read_through)
 
+    def put_many(self, items, serializer=DEFAULT_VALUE_SERIALIZER, read_through=False):
+        for id, value in items:
+            self.put(id, value, serializer, read_through)
+
     def _put_raise(self, id, value, serializer, read_through):
         cs.ensure_put(self, id, read_through)
         self._put_overwrite(id, value, serializer, read_through)
@@ -74,6 +78,19 @@ class MemoryStore(BaseBlobStore):
         cs.ensure_put(self, id, read_through, check_contains=False)
         self.values[id] = value
 
+    def put_many(self, items, serializer=DEFAULT_VALUE_SERIALIZER, read_through=False):
+        if self._on_duplicate_key not in {'skip', 'overwrite'}:
+            return super(MemoryStore, self).put_many(items, serializer, read_through)
+        if self._on_duplicate_key == 'skip':
+            # like repeated `put` calls, the first value for a repeated id wins
+            items = t.keyfilter(lambda id: id not in self,
+                                dict(reversed(list(items))))
+        else:
+            items = dict(items)
+        if items:
+            cs.ensure_put(self, None, read_through, check_contains=False)
+            self.values.update(items)
+
     def get(self, id, serialzier=None, **_kargs):
         cs.ensure_read(self)
         cs.ensure_present(self, id)
@@ -431,6 +431,14 @@ def _artifact_from_record(repo, record):
                     run_info=record.run_info)
 
 
+def _ensure_new_ids(repo, artifact_ids, contains=ops.contains):
+    seen = set()
+    for artifact_id in artifact_ids:
+        if artifact_id in seen or contains(repo, artifact_id):
+            raise cs.KeyExistsError(artifact_id, repo)
+        seen.add(artifact_id)
+
+
 class ArtifactRepository(object):
     def __init__(self, read=True, write=True, read_through_write=True,
                  delete=False):
@@ -446,6 +454,12 @@ class ArtifactRepository(object):
         cs.ensure_read(self)
         return [self.get_by_id(id) for id in artifact_ids]
 
+    def put_many(self, artifact_records, read_through=False):
+        artifact_records = list(artifact_records)
+        cs.ensure_put(self, None, read_through, check_contains=False)
+        _ensure_new_ids(self, [a.id for a in artifact_records])
+        return [self.put(record, read_through) for record in artifact_records]
+
 
 class MemoryRepo(ArtifactRepository):
     def __init__(self, artifacts=None,
@@ -538,18 +552,30 @@ class MemoryRepo(ArtifactRepository):
             raise KeyError(set_id, self)
 
 
+def _artifact_json(artifact):
+    return {'id': artifact.id, 'type': 'Artifact', 'name': artifact.name}
+
+
+def _proxy_json(proxy):
+    return {'id': proxy.artifact.id, 'type': 'ArtifactProxy', 'name': proxy.artifact.name}
+
+
+# keyed on the exact type so that each input costs a single dict probe
+_input_transforms = {Artifact: _artifact_json,
+                     ArtifactProxy: _proxy_json,
+                     CallableArtifactProxy: _proxy_json}
+
+
 def _transform(val):
-    if isinstance(val, (Artifact)):
-        return {'id': val.id, 'type': 'Artifact', 'name': val.name}
-    elif type(val) in {ArtifactProxy, CallableArtifactProxy}:
-        return {'id': val.artifact.id, 'type': 'ArtifactProxy', 'name': val.artifact.name}
-    else:
+    transform = _input_transforms.get(type(val))
+    if transform is None:
         return val
+    return transform(val)
 
 
 def _inputs_json(inputs):
-    expanded = t.valmap(_transform, inputs['kargs'])
-    expanded['__varargs'] = list(t.map(_transform, inputs['varargs']))
+    expanded = {k: _transform(v) for k, v in inputs['kargs'].items()}
+    expanded['__varargs'] = [_transform(v) for v in inputs['varargs']]
 
     return expanded
 
@@ -789,6 +815,34 @@ class PostgresRepo(ArtifactRepository):
 
             return _artifact_from_record(self, artifact_record)
 
+    def put_many(self, artifact_records, read_through=False):
+        artifact_records = list(artifact_records)
+        with self.session() as session:
+            cs.ensure_put(self, None, read_through, check_contains=False)
+            cs.ensure_contains(self)
+            artifact_ids = [a.id for a in artifact_records]
+            existing = {a.id for a in (session.query(db.Artifact.id)
+                                       .filter(db.Artifact.id.in_(artifact_ids)))}
+            _ensure_new_ids(self, artifact_ids,
+                            contains=lambda _, id: id in existing)
+
+            self.blobstore.put_many([(a.id, a.inputs) for a in artifact_records],
+                                    s.DEFAULT_INPUT_SERIALIZER)
+            for a in artifact_records:
+                self.blobstore.put(a.value_id, a.value, s.serializer(a))
+
+            runs = {}
+            for a in artifact_records:
+                if a.run_info['id'] not in runs:
+                    runs[a.run_info['id']] = self._upsert_run(session, a.run_info)
+
+            session.bulk_save_objects(
+                [db.Artifact(a, _inputs_json(a.inputs), runs[a.run_info['id']])
+                 for a in artifact_records])
+            session.commit()
+
+            return [_artifact_from_record(self, a) for a in artifact_records]
+
     def get_by_id(self, artifact_id):
         cs.ensure_read(self)
         with self.session() as session:
@@ -939,13 +993,41 @@ def _delete_set(store, id):
 class ChainedRepo(ArtifactRepository):
     def __init__(self, repos):
         self.stores = repos
+        # maps artifact ids to the store they were last found in
+        self._index = {}
 
-    def __contains__(self, id):
-        return cs.chained_contains(self, id)
+    def __contains__(self, artifact_or_id):
+        artifact_id = _artifact_id(artifact_or_id)
+        store = self._index.get(artifact_id)
+        if store is not None and store._read and artifact_id in store:
+            return True
+
+        def contains(store, id):
+            if id in store:
+                self._index[id] = store
+                return True
+            return False
+
+        self._index.pop(artifact_id, None)
+        return cs.chained_contains(self, artifact_id, contains=contains)
 
     def put(self, record):
+        self._index.pop(record.id, None)
         return cs.chained_put(self, record.id, record, put=_put_only_value)
 
+    def put_many(self, records, read_through=False):
+        records = list(records)
+        stores_with_write = [s for s in self.stores if s._write]
+        if len(stores_with_write) == 0:
+            raise cs.PermissionError('put', self, 'write')
+
+        # mirror chained_put, which only refuses ids every writable store has
+        def contains(chained, id):
+            return all(id in store for store in stores_with_write)
+
+        _ensure_new_ids(self, [r.id for r in records], contains=contains)
+        return [self.put(record) for record in records]
+
     def put_set(self, artifact_set, read_through=False):
         return cs.chained_put(self, None, artifact_set,
                               contains=_contains_set, put=_put_set)
@@ -953,7 +1035,9 @@ class ChainedRepo(ArtifactRepository):
     def get_by_id(self, artifact_id):
         def get(store, id):
             return store.get_by_id(id)
-        return cs.chained_get(self, get, artifact_id, put=_put_only_value)
+        artifact = cs.chained_get(self, get, artifact_id, put=_put_only_value)
+        self._forget_if_read_through(artifact.id)
+        return artifact
 
     def contains_set(self, id):
         return cs.chained_contains(self, id, contains=_contains_set)
@@ -975,7 +1059,22 @@ class ChainedRepo(ArtifactRepository):
     def get_by_value_id(self, value_id):
         def get(store, id):
             return store.get_by_value_id(id)
-        return cs.chained_get(self, get, value_id, put=_put_only_value)
+        artifact = cs.chained_get(self, get, value_id, put=_put_only_value)
+        self._forget_if_read_through(artifact.id)
+        return artifact
+
+    def _forget_if_read_through(self, artifact_id):
+        # a get may have copied the artifact into a read-through store ahead
+        # of the indexed one, in which case that earlier store should win
+        indexed = self._index.get(artifact_id)
+        if indexed is None:
+            return
+        for store in self.stores:
+            if store is indexed:
+                return
+            if store._read and store._read_through_write:
+                del self._index[artifact_id]
+                return
 
     def get_value(self, artifact):
         for store in self.stores:
@@ -986,6 +1085,7 @@ class ChainedRepo(ArtifactRepository):
         raise KeyError(artifact, self)
 
     def delete(self, id):
+        self._index.pop(_artifact_id(id), None)
         return cs.chained_delete(self, id)
 
     def _filename(self, id):
@@ -48,11 +48,23 @@ def db_engine(db_conn_str):
     return engine
 
 
-@pytest.fixture()
-def db_session(db_engine):
+@pytest.fixture(scope='module')
+def db_connection(db_engine):
     connection = db_engine.connect()
     transaction = connection.begin()
-    session = sessionmaker()(bind=connection)
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture()
+def db_session(db_connection):
+    # each test runs inside its own SAVEPOINT on the module's connection
+    # which is rolled back on teardown, so no test sees another's writes
+    savepoint = db_connection.begin_nested()
+    session = sessionmaker()(bind=db_connection)
 
     session.begin_nested()
 
@@ -64,9 +76,15 @@ def db_session(db_engine):
 
     yield session
 
+    # if the test rolled back past its savepoint its writes went into the
+    # module-wide transaction and would leak into later tests
+    assert savepoint.is_active, \
+        "the test's SAVEPOINT was rolled back, DB isolation was lost"
     session.close()
-    transaction.rollback()
-    connection.close()
+    # closing the session rolls the savepoint back on some SQLAlchemy
+    # versions; it was checked as active above so this is not a silent skip
+    if savepoint.is_active:
+        savepoint.rollback()
 
 
 @contextlib.contextmanager
@@ -200,6 +218,15 @@ def artifact_record(**kargs):
     return pc.ArtifactRecord(**artifact_props)
 
 
+@pytest.fixture(scope='module')
+def canned_artifact():
+    # the record's `inputs` and `run_info` dicts are shared by every test in
+    # the module (and by `_replace` copies); this is only safe because no repo
+    # mutates them. Use `canned_artifact._replace(id=..., value_id=...)` when a
+    # distinct artifact is needed.
+    return artifact_record(id='123', value_id='v123')
+
+
 @pytest.fixture()
 def with_check_mutations():
     p.set_check_mutations(True)
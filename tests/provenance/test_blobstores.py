@@ -71,6 +71,24 @@ def test_permissions():
     with pytest.raises(cs.PermissionError) as e:
         store.delete('a')
 
+
+def test_memory_blobstore_put_many():
+    store = bs.MemoryStore(read=True, write=True, delete=True)
+    store.put('a', 1)
+    store.put_many([('a', 10), ('b', 2), ('c', 3), ('b', 20)])
+    assert store.get('a') == 1
+    assert store.get('b') == 2
+    assert store.get('c') == 3
+
+    store = bs.MemoryStore(read=True, write=False, delete=True)
+    with pytest.raises(cs.PermissionError) as e:
+        store.put_many([('a', 1)])
+
+    store = bs.MemoryStore(read=False, write=True, delete=True)
+    with pytest.raises(cs.PermissionError) as e:
+        store.put_many([('a', 1)])
+
+
 def test_s3store(s3fs):
     tmp_dir = '/tmp/prov_s3store'
     shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -105,8 +105,31 @@ def test_basic_repo_ops(repo):
         repo.get_by_value_id(artifact.id)
 
 
-def test_repo_set_put_and_finding(repo):
-    artifact = artifact_record(id='123')
+def test_repo_put_many(repo):
+    artifacts = [artifact_record(id='a1'), artifact_record(id='a2'),
+                 artifact_record(id='a3')]
+
+    repo.put_many(artifacts)
+
+    for artifact in artifacts:
+        assert artifact.id in repo
+        assert repo.get_by_id(artifact.id).id == artifact.id
+
+    with pytest.raises(cs.KeyExistsError) as e:
+        repo.put_many(artifacts[:1])
+
+    new_artifact = artifact_record(id='new')
+    with pytest.raises(cs.KeyExistsError) as e:
+        repo.put_many([new_artifact, artifacts[0]])
+    assert new_artifact.id not in repo
+
+    with pytest.raises(cs.KeyExistsError) as e:
+        repo.put_many([new_artifact, new_artifact])
+    assert new_artifact.id not in repo
+
+
+def test_repo_set_put_and_finding(repo, canned_artifact):
+    artifact = canned_artifact
     repo.put(artifact)
     artifact_set = r.ArtifactSet([artifact.id], 'foo')
     repo.put_set(artifact_set)
@@ -127,10 +150,10 @@ def test_repo_raises_key_error_when_set_name_not_found(repo):
         repo.get_set_by_labels('foo')
 
 
-def test_repo_contains_set(repo):
+def test_repo_contains_set(repo, canned_artifact):
     assert not repo.contains_set('foo')
 
-    artifact = artifact_record(id='123')
+    artifact = canned_artifact
     repo.put(artifact)
     artifact_set = r.ArtifactSet([artifact.id], 'foo')
 
@@ -138,8 +161,8 @@ def test_repo_contains_set(repo):
     assert repo.contains_set(artifact_set.id)
 
 
-def test_repo_delete_set(repo):
-    artifact = artifact_record(id='123')
+def test_repo_delete_set(repo, canned_artifact):
+    artifact = canned_artifact
     repo.put(artifact)
     artifact_set = r.ArtifactSet(['123'], 'foo')
     repo.put_set(artifact_set)
@@ -150,52 +173,41 @@ def test_repo_delete_set(repo):
         repo.get_set_by_id(artifact_set.id)
 
 
-def test_permissions(atomic_repo):
+@pytest.mark.parametrize('flags,op', [
+    ({'_write': False}, lambda repo, a: repo.put(a)),
+    ({'_read': False}, lambda repo, a: repo.get_by_id(a.id)),
+    ({'_read': False}, lambda repo, a: repo.get_by_value_id(a.value_id)),
+    ({'_read': False}, lambda repo, a: repo.get_value(a)),
+    ({'_read': False}, lambda repo, a: repo.get_inputs(a)),
+    ({'_read': False}, lambda repo, a: a.id in repo),
+    ({'_delete': False}, lambda repo, a: repo.delete(a.id)),
+], ids=['put', 'get_by_id', 'get_by_value_id', 'get_value', 'get_inputs',
+        'contains', 'delete'])
+def test_permissions(atomic_repo, flags, op):
     repo = atomic_repo
     artifact = artifact_record()
-
-    repo._write = False
-    assert not repo._write
-
-    with pytest.raises(cs.PermissionError) as e:
+    if '_write' not in flags:
         repo.put(artifact)
-    assert artifact not in repo
-
-    repo._write = True
-    repo.put(artifact)
 
-    repo._read = False
+    for permission, setting in flags.items():
+        setattr(repo, permission, setting)
 
     with pytest.raises(cs.PermissionError) as e:
-        repo.get_by_id(artifact.id)
+        op(repo, artifact)
 
-    with pytest.raises(cs.PermissionError) as e:
-        repo.get_by_value_id(artifact.value_id)
-
-    with pytest.raises(cs.PermissionError) as e:
-        repo.get_value(artifact.id)
-
-    with pytest.raises(cs.PermissionError) as e:
-        repo.get_inputs(artifact)
-
-    with pytest.raises(cs.PermissionError) as e:
-        artifact.id in repo
+    for permission in flags:
+        setattr(repo, permission, True)
 
-    repo._read = True
-    assert repo.get_by_id(artifact.id)
-    assert artifact.id in repo
-
-    repo._delete = False
-    with pytest.raises(cs.PermissionError) as e:
+    if '_write' in flags:
+        assert artifact not in repo
+    else:
+        assert repo.get_by_id(artifact.id)
         repo.delete(artifact.id)
+        assert artifact.id not in repo
 
-    repo._delete = True
-    repo.delete(artifact.id)
-    assert artifact.id not in repo
 
-
-def test_chained_with_readonly():
-    read_repo = r.MemoryRepo([artifact_record(id='foo')],
+def test_chained_with_readonly(canned_artifact):
+    read_repo = r.MemoryRepo([canned_artifact._replace(id='foo', value_id='vfoo')],
                              read=True, write=False, delete=False)
     write_repo = r.MemoryRepo(read=True, write=True, delete=False)
     repos = [read_repo, write_repo]
@@ -203,9 +215,12 @@ def test_chained_with_readonly():
 
     # verify we read from the read-only store
     assert 'foo' in chained
+    assert chained._index['foo'] is read_repo
+    assert chained['foo'].id == 'foo'
+    assert chained._index['foo'] is read_repo
 
     # but that it is not written to
-    record = artifact_record(id='bar', value_id='baz')
+    record = canned_artifact._replace(id='bar', value_id='baz')
     chained.put(record)
     assert 'bar' in chained
     assert 'bar' in write_repo
@@ -215,8 +230,8 @@ def test_chained_with_readonly():
     assert chained.get_value(record) == record.value
 
 
-def test_chained_read_through_write():
-    foo = artifact_record(id='foo')
+def test_chained_read_through_write(canned_artifact):
+    foo = canned_artifact._replace(id='foo', value_id='vfoo')
     read_repo = r.MemoryRepo([foo], read=True, write=False)
     repo_ahead = r.MemoryRepo(read=True, write=True, read_through_write=True)
     read_through_write_repo = r.MemoryRepo(read=True, write=True,
@@ -230,16 +245,23 @@ def test_chained_read_through_write():
     assert 'foo' not in read_through_write_repo
     assert 'foo' not in no_read_through_write_repo
     assert 'foo' not in repo_ahead
+    assert 'foo' in chained_repo
+    assert chained_repo._index['foo'] is read_repo
     # verify we read from the read-only store
     assert chained_repo['foo'].id == foo.id
+    assert 'foo' not in chained_repo._index
 
     assert 'foo' in read_through_write_repo
     assert 'foo' not in repo_ahead
     assert 'foo' not in no_read_through_write_repo
 
+    # the next lookup finds the read-through copy first
+    assert 'foo' in chained_repo
+    assert chained_repo._index['foo'] is read_through_write_repo
+
 
-def test_chained_writes_may_be_allowed_on_read_throughs_only():
-    foo = artifact_record(id='foo')
+def test_chained_writes_may_be_allowed_on_read_throughs_only(canned_artifact):
+    foo = canned_artifact._replace(id='foo', value_id='vfoo')
     read_repo = r.MemoryRepo([foo], read=True, write=False)
     read_through_write_only_repo = r.MemoryRepo(read=True, write=False,
                                                 read_through_write=True)
@@ -253,7 +275,13 @@ def test_chained_writes_may_be_allowed_on_read_throughs_only():
     assert 'foo' in read_through_write_only_repo
     assert 'foo' not in write_repo
 
-    bar = artifact_record(id='bar')
+    # nothing ahead of the read repo copies on read, so the index is kept
+    no_read_through_chain = r.ChainedRepo([write_repo, read_repo])
+    assert 'foo' in no_read_through_chain
+    assert no_read_through_chain['foo'].id == foo.id
+    assert no_read_through_chain._index['foo'] is read_repo
+
+    bar = canned_artifact._replace(id='bar', value_id='vbar')
     chained_repo.put(bar)
     assert 'bar' in chained_repo
     assert 'bar' not in read_through_write_only_repo